@@ -2,23 +2,86 @@
 Locust load testing configuration for Web Gemini Performance Testbed
 """
 
-from locust import HttpUser, task, between
+from locust import task, between
+from locust.contrib.fasthttp import FastHttpUser
+from locust_plugins.connection_pools import FastHttpPool
 import random
 import json
+import numpy as np
+import orjson
 
-class WebGeminiUser(HttpUser):
+DRAW_POOL_SIZE = 10000  # Precomputed random draws per user (reused cyclically)
+MAX_CART_ITEMS = 5
+CHOICE_BATCH_SIZE = 4096  # URL choices drawn per random.choices call
+USER_POOL_SIZE = 1000  # Pool of user IDs that repeat (see on_start)
+SEARCH_TERMS = ['laptop', 'shirt', 'book', 'chair', 'ball', 'phone', 'shoes']
+SEARCH_PAGES = range(1, 6)
+
+# Request URLs are built once at import time and shared by all simulated users
+SEARCH_URLS = [
+    f"/products?search={term}&page={page}&limit=20"
+    for term in SEARCH_TERMS
+    for page in SEARCH_PAGES
+]
+DASHBOARD_URLS = [f"/users/{user_id}/dashboard" for user_id in range(1, USER_POOL_SIZE + 1)]
+RECOMMENDATION_URLS = [f"/recommendations/{user_id}" for user_id in range(1, USER_POOL_SIZE + 1)]
+
+class WebGeminiUser(FastHttpUser):
     """
     Simulates user behavior for load testing
+    Uses geventhttpclient (FastHttpUser) so the load generator is not the bottleneck
     """
     wait_time = between(1, 3)  # Wait 1-3 seconds between requests
+    network_timeout = 30.0  # Seconds to wait for a response
+    connection_timeout = 10.0  # Seconds to wait for a connection
+    pool_size = 4  # Sessions (sockets) each user rotates through
     
     def on_start(self):
         """Called when a simulated user starts"""
+        # Rotate requests across several keep-alive connections instead of one,
+        # so a single socket does not pin the user to one backend. FastHttpPool
+        # takes only user/size; each session copies the user's network_timeout
+        # and connection_timeout itself.
+        self.client = FastHttpPool(user=self, size=self.pool_size)
+        
         # Database has 200k users and 50k products
         # Use a smaller pool of user IDs that repeat to test caching effectively
         # This ensures cache hits during load tests
-        self.user_pool = list(range(1, 1001))  # Pool of 1000 users that will repeat
+        self.user_pool = list(range(1, USER_POOL_SIZE + 1))  # Pool of 1000 users that will repeat
         self.max_product_id = 50000
+        
+        # Precompute checkout randomness once per user; tasks only index into it.
+        # Narrow dtypes keep this ~0.3 MB per user (int64 would be ~1 MB)
+        self._rng = np.random.default_rng()
+        self._uid_draws = self._rng.integers(
+            1, len(self.user_pool) + 1, size=DRAW_POOL_SIZE, dtype=np.int32
+        )
+        self._num_items_draws = self._rng.integers(
+            1, MAX_CART_ITEMS + 1, size=DRAW_POOL_SIZE, dtype=np.uint8
+        )
+        self._pid_draws = self._rng.integers(
+            1, self.max_product_id + 1, size=(DRAW_POOL_SIZE, MAX_CART_ITEMS), dtype=np.int32
+        )
+        self._qty_draws = self._rng.integers(
+            1, 4, size=(DRAW_POOL_SIZE, MAX_CART_ITEMS), dtype=np.uint8
+        )
+        self._idx = 0
+        self._choice_batches = {}  # key -> iterator over pre-drawn choices
+    
+    def _next_draw(self):
+        """Return the next row index into the precomputed draws"""
+        i = self._idx % DRAW_POOL_SIZE
+        self._idx += 1
+        return i
+    
+    def _next_choice(self, key, population):
+        """Return the next pre-drawn element of population, refilling in batches"""
+        try:
+            return next(self._choice_batches[key])
+        except (KeyError, StopIteration):
+            batch = iter(random.choices(population, k=CHOICE_BATCH_SIZE))
+            self._choice_batches[key] = batch
+            return next(batch)
     
     @task(3)
     def search_products(self):
@@ -26,13 +89,9 @@ class WebGeminiUser(HttpUser):
         Task weight: 3 (most common operation)
         Tests: GET /products?search=...
         """
-        search_terms = ['laptop', 'shirt', 'book', 'chair', 'ball', 'phone', 'shoes']
-        term = random.choice(search_terms)
-        
-        # Add pagination for optimized version
-        page = random.randint(1, 5)
+        # Random term and page (pagination for optimized version)
         self.client.get(
-            f"/products?search={term}&page={page}&limit=20",
+            self._next_choice("search", SEARCH_URLS),
             name="/products?search=[term]"
         )
     
@@ -42,9 +101,8 @@ class WebGeminiUser(HttpUser):
         Task weight: 2 (common operation)
         Tests: GET /users/:id/dashboard
         """
-        user_id = random.choice(self.user_pool)
         self.client.get(
-            f"/users/{user_id}/dashboard",
+            self._next_choice("dashboard", DASHBOARD_URLS),
             name="/users/[id]/dashboard"
         )
     
@@ -55,9 +113,8 @@ class WebGeminiUser(HttpUser):
         Tests: GET /recommendations/:userId
         Uses a smaller pool of users to ensure cache hits
         """
-        user_id = random.choice(self.user_pool)
         self.client.get(
-            f"/recommendations/{user_id}",
+            self._next_choice("recommendations", RECOMMENDATION_URLS),
             name="/recommendations/[userId]"
         )
     
@@ -67,25 +124,25 @@ class WebGeminiUser(HttpUser):
         Task weight: 1 (less frequent write operation)
         Tests: POST /checkout
         """
-        user_id = random.choice(self.user_pool)
-        
-        # Create a random cart with 1-5 items
-        num_items = random.randint(1, 5)
-        items = []
-        selected_products = random.sample(range(1, self.max_product_id + 1), num_items)
+        i = self._next_draw()
+        user_id = int(self._uid_draws[i])
         
-        for product_id in selected_products:
-            items.append({
-                "productId": product_id,
-                "quantity": random.randint(1, 3)
-            })
+        # Create a random cart with 1-5 items (product ids may repeat; the server
+        # inserts one order item per entry)
+        num_items = int(self._num_items_draws[i])
+        items = [
+            {"productId": int(product_id), "quantity": int(quantity)}
+            for product_id, quantity in zip(
+                self._pid_draws[i, :num_items], self._qty_draws[i, :num_items]
+            )
+        ]
         
+        # Serialize with orjson and send raw bytes (skips the client's json.dumps)
+        body = orjson.dumps({"userId": user_id, "items": items})
         self.client.post(
             "/checkout",
-            json={
-                "userId": user_id,
-                "items": items
-            },
+            data=body,
+            headers={"Content-Type": "application/json"},
             name="/checkout"
         )
 
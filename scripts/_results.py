@@ -0,0 +1,478 @@
+#!/usr/bin/env python3
+"""
+Shared loading, table and output code for the results scripts
+
+extract-results.py, create-results-table.py and organize-runs-by-load.py are thin
+wrappers around this module. To run several steps in one interpreter (result
+files are loaded once and shared between steps):
+
+    python3 scripts/_results.py all        # extract (print only), table, organize
+    python3 scripts/_results.py extract    # same as extract-results.py
+    python3 scripts/_results.py table      # same as create-results-table.py
+    python3 scripts/_results.py organize   # same as organize-runs-by-load.py
+"""
+
+import csv
+import io
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from operator import attrgetter
+from pathlib import Path
+from collections import defaultdict
+
+try:
+    from orjson import dumps as json_dumps, loads as json_loads  # Faster C codec; works in bytes
+except ImportError:
+    import json
+
+    def json_dumps(obj):
+        return json.dumps(obj).encode()
+
+    json_loads = json.loads
+
+PROJECT_ROOT = Path(__file__).parent.parent
+CACHE_FILE = PROJECT_ROOT / '.cache' / 'metrics_index.json'
+
+SYSTEMS = [('baseline', 'Baseline'), ('gemini', 'Gemini')]
+LOADS = [50, 150, 250]
+
+# Aggregated-row columns read from each locust_{load}.csv
+LOCUST_COLUMNS = ('Average Response Time', '95%', 'Requests/s', 'Request Count', 'Failure Count')
+
+# Row formatters for the console and Markdown tables (bound .format methods)
+ROW_FMT = "{:<8} {:<12} {:<12.2f} {:<12.2f} {:<18.2f} {:<15.2f}".format
+MD_FMT = "| {} | {} | {:.2f} | {:.2f} | {:.2f} | {:.2f} |".format
+CSV_HEADER = ('Load', 'System', 'Avg(ms)', 'P95(ms)', 'Throughput(req/s)', 'Cache hit(%)')
+
+# Metric-name substring -> output key, checked in this order
+METRIC_KEYS = {
+    'Avg Latency': 'avg_ms',
+    'P95 Latency': 'p95_ms',
+    'Cache Hit Ratio': 'cache_hit_ratio',
+    'Throughput': 'throughput',
+}
+
+# Avg latency (ms) bucket edges and the load level each bucket is estimated as
+LOAD_BUCKET_EDGES = [600.0, 2000.0]
+LOAD_LABELS = ('50', '150', '250')
+
+@dataclass
+class Row:
+    """One (load, system) result; __slots__ avoids a per-row __dict__"""
+    __slots__ = ('load', 'system', 'avg_ms', 'p95_ms', 'throughput', 'cache_hit', 'error_rate')
+    load: int
+    system: str
+    avg_ms: float
+    p95_ms: float
+    throughput: float
+    cache_hit: float
+    error_rate: float
+
+def write_atomic(path, payload):
+    """Write payload to path via a .tmp file and os.replace, so readers never see a partial file"""
+    tmp = path + '.tmp'
+    with open(tmp, 'wb') as f:
+        f.write(payload.encode())
+    os.replace(tmp, path)
+
+def load_json(filepath):
+    """
+    Load JSON file
+    Only the first bytes are read up front: empty files (e.g. after a server
+    restart) and files that cannot hold an object/array return None unparsed
+    """
+    try:
+        with open(filepath, 'rb') as f:
+            head = b''
+            first = b''
+            while not first:
+                chunk = f.read(64)
+                if not chunk:
+                    return None
+                head += chunk
+                first = head.lstrip()[:1]
+            if first not in (b'{', b'['):
+                print(f"Warning: Could not load {filepath}: not a JSON object or array")
+                return None
+            return json_loads(head + f.read())
+    except ValueError as e:
+        print(f"Warning: Could not load {filepath}: {e}")
+        return None
+
+def read_aggregated_row(filepath, columns, default=None, tail_bytes=4096):
+    """
+    Return the requested columns of the 'Aggregated' row of a Locust stats CSV
+    Column positions come from the header once; rows are indexed as plain lists.
+    Locust writes that row last, so only the header line and the file tail are read
+    """
+    with open(filepath, 'rb') as f:
+        header = next(csv.reader([f.readline().decode()]), [])
+        size = os.fstat(f.fileno()).st_size
+        f.seek(max(f.tell(), size - tail_bytes))
+        lines = f.read().decode(errors='replace').strip().splitlines()
+
+    index = {name: i for i, name in enumerate(header)}
+    type_i = index.get('Type')
+    name_i = index.get('Name')
+    wanted = [index.get(name) for name in columns]
+
+    def pick(fields):
+        if name_i is None or name_i >= len(fields) or fields[name_i] != 'Aggregated':
+            return None
+        if type_i is not None and type_i < len(fields) and fields[type_i]:
+            return None
+        return [fields[i] if i is not None and i < len(fields) else default for i in wanted]
+
+    if lines:
+        values = pick(next(csv.reader([lines[-1]])))
+        if values is not None:
+            return values
+
+    # Unexpected layout: fall back to scanning the whole file
+    with open(filepath, 'r') as f:
+        for fields in csv.reader(f):
+            values = pick(fields)
+            if values is not None:
+                return values
+    return None
+
+def run_paths(folder, load):
+    """Return the (JSON summary, Locust CSV) paths of one configuration"""
+    return f'results/{folder}/{load}.json', f'results/{folder}/locust_{load}.csv'
+
+def load_run(folder, load):
+    """
+    Load results/{folder}/{load}.json and the Aggregated row of locust_{load}.csv
+    Returns (json_data, locust_row, missing_paths); a missing file gives None
+    """
+    json_path, csv_path = run_paths(folder, load)
+    missing = [path for path in (json_path, csv_path) if not os.path.isfile(path)]
+
+    json_data = None if json_path in missing else load_json(json_path)
+    locust_row = None if csv_path in missing else read_aggregated_row(csv_path, LOCUST_COLUMNS, default=0)
+    return json_data, locust_row, missing
+
+def load_run_safe(job):
+    """Run load_run for a (folder, system, load) job; returns (loaded, error)"""
+    folder, _, load = job
+    try:
+        return load_run(folder, load), None
+    except Exception as e:
+        return None, e
+
+def load_runs():
+    """
+    Load every (folder, system, load) configuration
+    Returns a list of ((folder, system, load), loaded, error) in SYSTEMS x LOADS order
+    """
+    jobs = [(folder, system, load) for folder, system in SYSTEMS for load in LOADS]
+
+    # Small files: load every configuration concurrently so the kernel overlaps the reads
+    with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+        loaded = list(executor.map(load_run_safe, jobs))
+
+    return [(job, result, error) for job, (result, error) in zip(jobs, loaded)]
+
+def error_rate(locust_row):
+    """Failure percentage of an Aggregated row read with LOCUST_COLUMNS"""
+    total_requests = int(locust_row[3])
+    failures = int(locust_row[4])
+    return round(failures / total_requests * 100, 2) if total_requests > 0 else 0
+
+def extract_row(folder, system, load, loaded):
+    """Row from the JSON summary (latency/cache) and Locust CSV (throughput), or None"""
+    json_data, locust_row, missing = loaded
+    if missing:
+        print(f"Warning: Skipping {system} load {load}: {' and '.join(missing)} not found")
+        return None
+    if not (isinstance(json_data, dict) and json_data and locust_row):
+        return None
+    return Row(
+        load=load,
+        system=system,
+        avg_ms=json_data.get('avg_ms', 0),
+        p95_ms=json_data.get('p95_ms', 0),
+        throughput=round(float(locust_row[2]), 2),
+        cache_hit=json_data.get('cache_hit_ratio', 0),
+        error_rate=error_rate(locust_row)
+    )
+
+def table_row(folder, system, load, loaded):
+    """
+    Row for a configuration with a Locust CSV, or None
+    Uses the JSON summary when it has enough requests (>100), otherwise the CSV
+    """
+    json_data, locust_row, missing = loaded
+    if locust_row is None:
+        _, csv_path = run_paths(folder, load)
+        if csv_path in missing:
+            print(f"Error loading {folder} {load}: {csv_path} not found")
+        return None
+
+    if isinstance(json_data, dict) and json_data.get('requests', 0) > 100:
+        avg_ms = json_data['avg_ms']
+        p95_ms = json_data['p95_ms']
+        cache_hit = json_data['cache_hit_ratio']
+    else:
+        # Use CSV data (more reliable when server restarted)
+        avg_ms = float(locust_row[0])
+        p95_ms = float(locust_row[1])
+        cache_hit = 0  # CSV doesn't have cache hit data
+
+    return Row(
+        load=load,
+        system=system,
+        avg_ms=avg_ms,
+        p95_ms=p95_ms,
+        throughput=float(locust_row[2]),
+        cache_hit=cache_hit,
+        error_rate=error_rate(locust_row)
+    )
+
+def build_rows(runs, make_row):
+    """
+    Apply make_row to every loaded configuration
+    Each (system, load) pair is isolated: a load or row-building error is reported
+    and the remaining pairs still produce rows
+    """
+    results = []
+    for (folder, system, load), loaded, error in runs:
+        if error is None:
+            try:
+                row = make_row(folder, system, load, loaded)
+            except Exception as e:
+                error = e
+        if error is not None:
+            print(f"Error loading {folder} {load}: {error}")
+        elif row is not None:
+            results.append(row)
+    return results
+
+def extract_rows(runs):
+    """Rows that have both a JSON summary and a Locust CSV, in SYSTEMS x LOADS order"""
+    return build_rows(runs, extract_row)
+
+def table_rows(runs):
+    """Rows for every configuration with a Locust CSV, sorted by load"""
+    results = build_rows(runs, table_row)
+
+    # Sort by load, then system name (Baseline before Gemini)
+    results.sort(key=attrgetter('load', 'system'))
+    return results
+
+def build_table(results):
+    """Print the console results table"""
+    print("=" * 90)
+    print("MAIN RESULTS TABLE")
+    print("=" * 90)
+    print(f"{'Load':<8} {'System':<12} {'Avg(ms)':<12} {'P95(ms)':<12} {'Throughput(req/s)':<18} {'Cache hit(%)':<15}")
+    print("-" * 90)
+
+    for r in results:
+        print(ROW_FMT(r.load, r.system, r.avg_ms, r.p95_ms, r.throughput, r.cache_hit))
+
+    print("=" * 90)
+
+def write_outputs(results):
+    """Write results/RESULTS_TABLE.md and results/RESULTS_TABLE.csv"""
+    os.makedirs('results', exist_ok=True)
+
+    md_lines = [
+        "# Performance Results Table",
+        "",
+        "| Load | System | Avg(ms) | P95(ms) | Throughput(req/s) | Cache hit(%) |",
+        "|------|--------|---------|---------|-------------------|-------------|",
+    ]
+    md_lines += [
+        MD_FMT(r.load, r.system, r.avg_ms, r.p95_ms, r.throughput, r.cache_hit)
+        for r in results
+    ]
+    md_lines += [
+        "",
+        "## Notes",
+        "- Load: Number of concurrent users",
+        "- Avg(ms): Average response time in milliseconds",
+        "- P95(ms): 95th percentile response time in milliseconds",
+        "- Throughput: Requests per second",
+        "- Cache hit(%): Percentage of requests served from cache",
+        "",
+    ]
+    write_atomic('results/RESULTS_TABLE.md', "\n".join(md_lines))
+
+    # CSV rows go through csv.writer in one writerows call (the loop runs in C and
+    # fields are quoted if needed), buffered so the file is still written once
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    writer.writerow(CSV_HEADER)
+    writer.writerows(
+        (r.load, r.system, f"{r.avg_ms:.2f}", f"{r.p95_ms:.2f}", f"{r.throughput:.2f}", f"{r.cache_hit:.2f}")
+        for r in results
+    )
+    write_atomic('results/RESULTS_TABLE.csv', buf.getvalue())
+
+    print(f"\n✅ Results table saved to: results/RESULTS_TABLE.md")
+    print(f"✅ Results CSV saved to: results/RESULTS_TABLE.csv")
+
+def load_metrics_csv(filepath):
+    """Load metrics CSV and return dict"""
+    try:
+        metrics_dict = {}
+        with open(filepath, 'r') as f:
+            lines = f.read().splitlines()
+        # Fixed two-column Metric,Value file (no quoting): split each line directly
+        for line in lines[1:]:
+            metric_name, _, value_str = line.partition(',')
+            metric_name = metric_name.strip()
+            for substring, key in METRIC_KEYS.items():
+                if substring in metric_name:
+                    try:
+                        metrics_dict[key] = float(value_str)
+                    except ValueError:
+                        pass
+                    break
+        return metrics_dict if metrics_dict else None
+    except Exception as e:
+        return None
+
+def load_cache():
+    """Load the parsed-metrics cache: {path: [mtime_ns, size, metrics_dict]}"""
+    try:
+        with open(CACHE_FILE, 'rb') as f:
+            cache = json_loads(f.read())
+        return cache if isinstance(cache, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+def save_cache(cache):
+    """Persist the parsed-metrics cache (best effort)"""
+    try:
+        CACHE_FILE.parent.mkdir(exist_ok=True)
+        with open(CACHE_FILE, 'wb') as f:
+            f.write(json_dumps(cache))
+    except OSError:
+        pass
+
+def load_metrics_cached(filepath, cache, seen):
+    """
+    load_metrics_csv, skipping the parse when the file's mtime and size are unchanged
+    The entry used is recorded in seen, which becomes the cache that is saved
+    """
+    st = os.stat(filepath)
+    entry = cache.get(filepath)
+    if not (entry and entry[0] == st.st_mtime_ns and entry[1] == st.st_size):
+        entry = [st.st_mtime_ns, st.st_size, load_metrics_csv(filepath)]
+    seen[filepath] = entry
+    return entry[2]
+
+def organize_files():
+    """Organize timestamped files by estimated load level"""
+    import numpy as np  # Only this step needs numpy; keep it off the extract/table startup path
+
+    cache = load_cache()
+    seen = {}  # Entries for files listed in this run; deleted/renamed files drop out
+    load_labels = np.array(LOAD_LABELS)
+
+    for folder in ['baseline', 'gemini']:
+        print(f"\n{'='*80}")
+        print(f"Organizing {folder.upper()} files")
+        print(f"{'='*80}\n")
+
+        # One directory read; names are filtered without building Path objects
+        try:
+            with os.scandir(os.path.join(PROJECT_ROOT, 'results', folder)) as it:
+                metrics_files = [
+                    entry for entry in it
+                    if entry.name.startswith('metrics-') and entry.name.endswith('.csv')
+                ]
+        except FileNotFoundError:
+            metrics_files = []
+        metrics_files.sort(key=lambda entry: entry.name)
+
+        if not metrics_files:
+            print(f"No metrics files found in results/{folder}/")
+            continue
+
+        # Group by similar metrics (estimate load level)
+        groups = defaultdict(list)
+
+        parsed = []
+        for mfile in metrics_files:
+            data = load_metrics_cached(mfile.path, cache, seen)
+            if data and data.get('avg_ms', 0) > 0:
+                parsed.append((mfile, data))
+
+        # Estimate load level based on avg latency ranges, all files at once
+        avgs = np.fromiter((data['avg_ms'] for _, data in parsed), dtype=np.float64, count=len(parsed))
+        labels = load_labels[np.digitize(avgs, LOAD_BUCKET_EDGES)].tolist()
+        for load_est, entry in zip(labels, parsed):
+            groups[load_est].append(entry)
+
+        # Print groups
+        for load in LOAD_LABELS:
+            if load in groups:
+                files = groups[load]
+                print(f"Load {load} ({len(files)} files):")
+                for mfile, data in files[:10]:  # Show first 10
+                    print(f"  {mfile.name}")
+                    print(f"    Avg: {data.get('avg_ms', 0):.2f}ms, "
+                          f"P95: {data.get('p95_ms', 0):.2f}ms, "
+                          f"Throughput: {data.get('throughput', 0):.2f} req/s")
+                if len(files) > 10:
+                    print(f"  ... and {len(files) - 10} more files")
+                print()
+
+    save_cache(seen)
+
+def run_extract(runs, write=True):
+    """extract step: JSON + CSV results table; returns an exit status"""
+    results = extract_rows(runs)
+
+    if not results:
+        print("ERROR: No results found. Check that all JSON and CSV files exist.")
+        return 1
+
+    print(f"\nFound {len(results)} result sets")
+    build_table(results)
+    if write:
+        write_outputs(results)
+    return 0
+
+def run_table(runs):
+    """table step: results table with CSV fallback; returns an exit status"""
+    results = table_rows(runs)
+    build_table(results)
+    write_outputs(results)
+    return 0
+
+COMMANDS = ('extract', 'table', 'organize', 'all')
+
+def main(argv=None):
+    """Run one subcommand (or all of them); returns an exit status"""
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) != 1 or argv[0] not in COMMANDS:
+        print(f"Usage: python3 scripts/_results.py {{{','.join(COMMANDS)}}}")
+        return 1
+
+    command = argv[0]
+    if command == 'organize':
+        organize_files()
+        return 0
+
+    # Result files are loaded once and shared by the extract and table steps
+    runs = load_runs()
+    if command == 'extract':
+        return run_extract(runs)
+    if command == 'table':
+        return run_table(runs)
+
+    # Every step runs even if an earlier one finds nothing (the table step has a
+    # CSV-only fallback); only the table step writes RESULTS_TABLE.md/.csv, since
+    # it would overwrite the extract step's files anyway
+    statuses = [run_extract(runs, write=False), run_table(runs)]
+    organize_files()
+    return max(statuses)
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -7,13 +7,28 @@ and an optional ablation mode (results/ablation/*).
 
 import json
 import csv
+import io
 import os
 import sys
 import math
+import re
 import numpy as np
 from pathlib import Path
 from collections import defaultdict
-
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+# Metric names written by server/src/metrics.js -> our standard keys
+METRIC_MAP = {
+    'Avg Latency (ms)': 'avg_ms',
+    'P95 Latency (ms)': 'p95_ms',
+    'Cache Hit Ratio (%)': 'cache_hit_ratio',
+    'Throughput (req/s)': 'throughput',
+}
+
+# File loaders are memoized per path: repeated reads of the same run file are
+# dict lookups. Returned dicts are shared, so callers must treat them as read-only.
+@lru_cache(maxsize=4096)
 def load_json(filepath):
     """Load JSON file and return data"""
     try:
@@ -26,6 +41,7 @@ def load_json(filepath):
         print(f"Warning: Could not load {filepath}: {e}")
         return None
 
+@lru_cache(maxsize=4096)
 def load_csv(filepath):
     """Load Locust CSV and extract aggregated data"""
     try:
@@ -39,6 +55,7 @@ def load_csv(filepath):
         print(f"Warning: Could not load {filepath}: {e}")
         return None
 
+@lru_cache(maxsize=4096)
 def load_metrics_csv(filepath):
     """Load metrics CSV file (from /metrics endpoint export)
     Format: Metric,Value rows
@@ -47,23 +64,16 @@ def load_metrics_csv(filepath):
     try:
         metrics_dict = {}
         with open(filepath, 'r') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                metric_name = row.get('Metric', '').strip()
-                value_str = row.get('Value', '').strip()
-                if metric_name and value_str:
-                    # Convert to numeric value
+            # Fixed two-column format without quoting: a plain split is enough
+            for line in f:
+                metric_name, sep, value_str = line.partition(',')
+                if not sep:
+                    continue
+                # Map to our standard keys (header and unknown metrics are skipped)
+                key = METRIC_MAP.get(metric_name.strip())
+                if key:
                     try:
-                        value = float(value_str)
-                        # Map to our standard keys
-                        if 'Avg Latency' in metric_name:
-                            metrics_dict['avg_ms'] = value
-                        elif 'P95 Latency' in metric_name:
-                            metrics_dict['p95_ms'] = value
-                        elif 'Cache Hit Ratio' in metric_name:
-                            metrics_dict['cache_hit_ratio'] = value
-                        elif 'Throughput' in metric_name:
-                            metrics_dict['throughput'] = value
+                        metrics_dict[key] = float(value_str)
                     except ValueError:
                         pass
         return metrics_dict if metrics_dict else None
@@ -71,26 +81,91 @@ def load_metrics_csv(filepath):
         print(f"Warning: Could not load metrics CSV {filepath}: {e}")
         return None
 
+def load_run_file(filepath):
+    """Load a run file by extension (JSON metrics, metrics CSV or Locust CSV)"""
+    filepath = os.fspath(filepath)
+    if filepath.endswith('.json'):
+        return load_json(filepath)
+    if filepath.endswith('.csv'):
+        # Try metrics CSV format first, then fall back to Locust CSV
+        return load_metrics_csv(filepath) or load_csv(filepath)
+    return None
+
+def preload_run_files(run_files):
+    """
+    Load every run file exactly once, in parallel
+    Returns dict mapping filepath string -> loaded data (or None)
+    """
+    paths = sorted({os.fspath(f) for f in run_files})
+    if not paths:
+        return {}
+    # Small files, I/O bound: threads overlap the open/read syscalls
+    with ThreadPoolExecutor() as executor:
+        return dict(zip(paths, executor.map(load_run_file, paths)))
+
+# Run-file name patterns, in the order their matches are listed for a configuration
+# (same files, same order as the {load}.json / {load}_run*.json / locust_{load}*.csv globs)
+JSON_RUN_PATTERNS = [
+    re.compile(r'(\d+)\.json'),  # Exact match first
+    re.compile(r'(\d+)_run.*\.json'),  # Then run-numbered files
+]
+CSV_RUN_PATTERNS = [
+    re.compile(r'locust_(\d+)\.csv'),  # Exact match
+    re.compile(r'locust_(\d+)_run.*\.csv'),  # Run-numbered
+    re.compile(r'(\d+)_run.*_stats\.csv'),  # Stats files from runs
+]
+# Server-side metrics exports tagged with their load (run-benchmark-grid.sh passes
+# ?load= to /metrics/export). Untagged timestamped exports are ambiguous and skipped:
+# bucketing them by latency mis-assigns 100/200/300.
+METRICS_RUN_PATTERNS = [
+    re.compile(r'metrics-.*-load(\d+)\.csv'),
+]
+
+def _match_run_file(name, patterns):
+    """Return (pattern_index, load) for the first pattern matching name, else None"""
+    for idx, pattern in enumerate(patterns):
+        m = pattern.fullmatch(name)
+        if m:
+            return idx, m.group(1)
+    return None
+
+def group_run_files(folder_path):
+    """
+    Group a results folder's run files by load level in a single directory pass
+    (one os.scandir call; names are matched without extra stat calls)
+    Returns dict load -> (json_files, csv_files, metrics_files) of path strings
+    """
+    try:
+        with os.scandir(folder_path) as it:
+            entries = [(entry.name, entry.path) for entry in it]
+    except (FileNotFoundError, NotADirectoryError):
+        return {}
+    
+    matched = defaultdict(lambda: ([], [], []))
+    for name, path in entries:
+        for kind, patterns in enumerate((JSON_RUN_PATTERNS, CSV_RUN_PATTERNS, METRICS_RUN_PATTERNS)):
+            hit = _match_run_file(name, patterns)
+            if hit:
+                idx, load = hit
+                matched[load][kind].append((idx, path))
+                break
+    
+    # Stable sort by pattern keeps directory order within each pattern
+    return {
+        load: tuple([path for _, path in sorted(files, key=lambda x: x[0])] for files in kinds)
+        for load, kinds in matched.items()
+    }
+
 def compute_stats(values):
     """
     Compute mean and sample standard deviation (n-1 denominator)
+    Single-metric view of summarize_columns; None values are skipped
     Returns: (mean, std, n)
     """
-    if not values or len(values) == 0:
+    if not values:
         return (0, 0, 0)
     
-    values = [float(v) for v in values if v is not None]
-    if len(values) == 0:
-        return (0, 0, 0)
-    
-    n = len(values)
-    mean = np.mean(values)
-    
-    if n == 1:
-        std = 0.0
-    else:
-        std = np.std(values, ddof=1)  # Sample standard deviation (n-1)
-    
+    mean, std, n, _ = summarize_columns([[v for v in values if v is not None]])[0]
     return (mean, std, n)
 
 def t_confidence_interval(mean, std, n, alpha=0.05):
@@ -277,77 +352,84 @@ def welch_t_pvalue_two_sided(sample1, sample2):
         return float(min(max(p, 0.0), 1.0)), t_stat, df
 
 
-def check_outliers(values, threshold=2.0):
-    """
-    Check for outliers using z-score method
-    Returns list of outlier indices
-    """
-    if len(values) < 3:
-        return []
-    
-    values = np.array([float(v) for v in values])
-    mean = np.mean(values)
-    std = np.std(values, ddof=1)
-    
-    if std == 0:
-        return []
-    
-    z_scores = np.abs((values - mean) / std)
-    outliers = np.where(z_scores > threshold)[0].tolist()
-    return outliers
+# Pre-built "mean \\pm SD" formatters for other common precisions
+# (2 decimals, the default, uses a literal f-string in format_latex)
+_LATEX_FORMATS = {
+    1: "{:.1f} \\pm {:.1f}".format,
+    3: "{:.3f} \\pm {:.3f}".format,
+}
 
 def format_latex(mean, std, decimals=2):
     """Format as LaTeX: mean \\pm SD"""
+    if decimals == 2:
+        return f"{mean:.2f} \\pm {std:.2f}"
+    fmt = _LATEX_FORMATS.get(decimals)
+    if fmt:
+        return fmt(mean, std)
     return f"{mean:.{decimals}f} \\pm {std:.{decimals}f}"
 
-def analyze_runs(run_files, metric_name, extract_func, file_data_map=None):
+def collect_values(run_files, extract_func, file_data_map=None):
     """
-    Analyze multiple runs for a specific metric
-    run_files: list of file paths
-    metric_name: name of the metric
-    extract_func: function to extract metric (can take filepath or data)
-    file_data_map: optional dict mapping filepath -> pre-loaded data
+    Extract one metric from each run file
+    Returns (values, file_data) where file_data is a list of (filepath, value)
     """
     values = []
     file_data = []
     
     for filepath in run_files:
-        # Convert Path to string if needed
-        filepath_str = str(filepath)
+        # Paths are usually already strings (os.scandir); fspath also accepts Path
+        filepath_str = os.fspath(filepath)
         
-        # If we have pre-loaded data, use it
-        if file_data_map and filepath_str in file_data_map:
+        # Use pre-loaded data when available, otherwise load the file
+        if file_data_map is not None and filepath_str in file_data_map:
             data = file_data_map[filepath_str]
-            value = extract_func(filepath)  # Pass filepath, extract_func uses map
-            if value is not None:
-                values.append(value)
-                file_data.append((filepath_str, value))
-            continue
-        
-        # Otherwise, load file and extract
-        if filepath_str.endswith('.json'):
-            data = load_json(filepath_str)
-        elif filepath_str.endswith('.csv'):
-            # Try metrics CSV format first
-            data = load_metrics_csv(filepath_str)
-            if not data:
-                # Fallback to Locust CSV
-                data = load_csv(filepath_str)
         else:
-            continue
+            data = load_run_file(filepath_str)
         
         if data:
-            value = extract_func(data)  # Pass data directly
+            value = extract_func(data)
             if value is not None:
                 values.append(value)
                 file_data.append((filepath_str, value))
     
-    if len(values) == 0:
-        return None
+    return values, file_data
+
+def summarize_columns(columns, threshold=2.0):
+    """
+    Compute mean, sample standard deviation and z-score outliers for several metrics
+    The value lists are NaN-padded into one (metrics x runs) array, so mean, sample
+    standard deviation and z-score outliers for every metric come from a few numpy
+    reductions instead of one pass per metric
+    Returns list of (mean, std, n, outlier_indices), one per column
+    """
+    if not columns:
+        return []
+    
+    width = max(len(col) for col in columns)
+    arr = np.full((len(columns), width), np.nan)
+    for i, col in enumerate(columns):
+        arr[i, :len(col)] = [float(v) for v in col]
     
-    mean, std, n = compute_stats(values)
-    outliers = check_outliers(values)
+    n = np.count_nonzero(~np.isnan(arr), axis=1)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = np.nansum(arr, axis=1) / n
+        dev = arr - mean[:, None]
+        std = np.sqrt(np.nansum(dev * dev, axis=1) / (n - 1))  # Sample std (n-1)
+        std = np.where(n > 1, std, 0.0)
+        z_scores = np.abs(dev) / std[:, None]
+    # Outliers need 3+ runs and non-zero spread
+    flagged = (z_scores > threshold) & ((n >= 3) & (std != 0))[:, None]
     
+    summaries = []
+    for i in range(len(columns)):
+        if n[i] == 0:
+            summaries.append((0, 0, 0, []))
+        else:
+            summaries.append((mean[i], std[i], int(n[i]), np.flatnonzero(flagged[i]).tolist()))
+    return summaries
+
+def build_run_result(metric_name, values, file_data, mean, std, n, outliers):
+    """Assemble the per-metric result dict used by the report and LaTeX tables"""
     return {
         'metric': metric_name,
         'values': values,
@@ -376,9 +458,27 @@ def extract_throughput_from_csv(data):
         return float(data.get('Requests/s', 0))
     return None
 
-def process_test_configuration(config_name, json_files, csv_files, metrics_files=None):
+# (results key, metric label, field in JSON / metrics CSV data)
+METRIC_FIELDS = [
+    ('avg_latency', 'Avg Latency (ms)', 'avg_ms'),
+    ('p95_latency', 'P95 Latency (ms)', 'p95_ms'),
+    ('cache_hit', 'Cache Hit Ratio (%)', 'cache_hit_ratio'),
+    ('throughput', 'Throughput (req/s)', 'throughput'),
+]
+
+def make_field_extractor(field):
+    """Return an extract_func that reads one field from loaded JSON / metrics CSV data"""
+    def extract(data):
+        return data.get(field) if isinstance(data, dict) else None
+    return extract
+
+# Built once at import instead of a fresh closure per metric per configuration
+FIELD_EXTRACTORS = {field: make_field_extractor(field) for _, _, field in METRIC_FIELDS}
+
+def process_test_configuration(config_name, json_files, csv_files, metrics_files=None, file_data_map=None):
     """
     Process a test configuration (e.g., "Baseline 50" or "Gemini 150")
+    file_data_map: optional dict mapping filepath -> pre-loaded data (see preload_run_files)
     """
     print(f"\n{'='*80}")
     print(f"Processing: {config_name}")
@@ -386,136 +486,89 @@ def process_test_configuration(config_name, json_files, csv_files, metrics_files
     
     results = {}
     
-    # Prioritize metrics CSV files if we have 3+ (for proper statistics)
-    use_metrics_csv = metrics_files and len(metrics_files) >= 3
-    
-    # Extract metrics from JSON files (only if we don't have enough CSV metrics)
-    if json_files and not use_metrics_csv:
-        # Average latency
-        avg_latency = analyze_runs(
-            json_files,
-            'Avg Latency (ms)',
-            lambda d: d.get('avg_ms') if isinstance(d, dict) else None
-        )
-        if avg_latency:
-            results['avg_latency'] = avg_latency
-        
-        # P95 latency
-        p95_latency = analyze_runs(
-            json_files,
-            'P95 Latency (ms)',
-            lambda d: d.get('p95_ms') if isinstance(d, dict) else None
-        )
-        if p95_latency:
-            results['p95_latency'] = p95_latency
-        
-        # Cache hit ratio
-        cache_hit = analyze_runs(
-            json_files,
-            'Cache Hit Ratio (%)',
-            lambda d: d.get('cache_hit_ratio') if isinstance(d, dict) else None
-        )
-        if cache_hit:
-            results['cache_hit'] = cache_hit
-    
-    # Extract throughput from CSV files (Locust)
-    if csv_files:
-        throughput = analyze_runs(
-            csv_files,
-            'Throughput (req/s)',
-            extract_throughput_from_csv
-        )
-        if throughput:
-            results['throughput'] = throughput
-    
-    # Extract metrics from timestamped metrics CSV files
-    # Group by load level by checking file timestamps and assuming they're from same test
+    # Pick the data source up front: 3+ valid load-tagged metrics CSV files
+    # (for proper statistics) override the JSON files for latency and cache hit.
+    # Throughput always comes from the Locust CSVs (client-side Requests/s), as in
+    # export-paper-tables.py; the server's metrics throughput is requests/timeSpan
+    metrics_data = []
     if metrics_files and len(metrics_files) >= 3:
         print(f"  Found {len(metrics_files)} metrics CSV files for {config_name}")
         # Sort by timestamp
-        sorted_metrics = sorted(metrics_files, key=lambda x: x.name)
+        sorted_metrics = sorted(metrics_files, key=os.path.basename)
         
-        # Extract metrics from all files
-        metrics_data = []
         for mfile in sorted_metrics:
-            data = load_metrics_csv(str(mfile))
+            mfile = os.fspath(mfile)
+            if file_data_map is not None and mfile in file_data_map:
+                data = file_data_map[mfile]
+            else:
+                data = load_metrics_csv(mfile)
             if data and data.get('avg_ms', 0) > 0:  # Only include non-zero metrics
                 metrics_data.append((mfile, data))
         
         print(f"  Valid metrics files: {len(metrics_data)}")
+    
+    use_metrics_csv = len(metrics_data) >= 3
+    if use_metrics_csv:
+        metrics_paths = [f[0] for f in metrics_data]
+        data_map = dict(metrics_data)
+        min_runs = 3
+    else:
+        data_map = file_data_map
+        min_runs = 1
+    
+    collected = []
+    for key, label, field in METRIC_FIELDS:
+        if key == 'throughput':
+            # Throughput comes from the Locust CSV files
+            run_files, extract_func, source_map = csv_files, extract_throughput_from_csv, file_data_map
+        elif use_metrics_csv:
+            run_files, extract_func, source_map = metrics_paths, FIELD_EXTRACTORS[field], data_map
+        else:
+            run_files, extract_func, source_map = json_files, FIELD_EXTRACTORS[field], data_map
+        if not run_files:
+            continue
         
-        # If we have at least 3 valid metrics files, use them (override JSON if needed)
-        if len(metrics_data) >= 3:
-            # Create a lookup dict for file -> data
-            file_data_map = {str(f[0]): f[1] for f in metrics_data}
-            
-            # Extract avg_ms (always use CSV if we have 3+ files)
-            avg_from_metrics = analyze_runs(
-                [f[0] for f in metrics_data],
-                'Avg Latency (ms)',
-                lambda f: file_data_map.get(str(f), {}).get('avg_ms') if file_data_map.get(str(f)) else None,
-                file_data_map
-            )
-            if avg_from_metrics and avg_from_metrics['n'] >= 3:
-                results['avg_latency'] = avg_from_metrics
-            
-            # Extract p95_ms
-            p95_from_metrics = analyze_runs(
-                [f[0] for f in metrics_data],
-                'P95 Latency (ms)',
-                lambda f: file_data_map.get(str(f), {}).get('p95_ms') if file_data_map.get(str(f)) else None,
-                file_data_map
-            )
-            if p95_from_metrics and p95_from_metrics['n'] >= 3:
-                results['p95_latency'] = p95_from_metrics
-            
-            # Extract cache_hit_ratio
-            cache_from_metrics = analyze_runs(
-                [f[0] for f in metrics_data],
-                'Cache Hit Ratio (%)',
-                lambda f: file_data_map.get(str(f), {}).get('cache_hit_ratio') if file_data_map.get(str(f)) else None,
-                file_data_map
-            )
-            if cache_from_metrics and cache_from_metrics['n'] >= 3:
-                results['cache_hit'] = cache_from_metrics
-            
-            # Extract throughput if available
-            thr_from_metrics = analyze_runs(
-                [f[0] for f in metrics_data],
-                'Throughput (req/s)',
-                lambda f: file_data_map.get(str(f), {}).get('throughput') if file_data_map.get(str(f)) else None,
-                file_data_map
-            )
-            if thr_from_metrics and thr_from_metrics['n'] >= 3:
-                results['throughput'] = thr_from_metrics
+        values, file_data = collect_values(run_files, extract_func, source_map)
+        if values:
+            collected.append((key, label, values, file_data))
     
-    # Print results
+    # Statistics for all metrics of this configuration in one vectorized pass
+    summaries = summarize_columns([values for _, _, values, _ in collected])
+    for (key, label, values, file_data), (mean, std, n, outliers) in zip(collected, summaries):
+        # The 3-run minimum applies to metrics-CSV sourced values only
+        if n >= (1 if key == 'throughput' else min_runs):
+            results[key] = build_run_result(label, values, file_data, mean, std, n, outliers)
+    
+    # Print results (buffered: one stdout write per configuration)
+    buf = io.StringIO()
     for key, result in results.items():
-        print(f"\n{result['metric']}:")
-        print(f"  Files: {len(result['files'])}")
-        print(f"  Values: {result['values']}")
-        print(f"  Mean: {result['mean']:.2f}")
-        print(f"  Std Dev: {result['std']:.2f}")
-        print(f"  LaTeX: {result['latex']}")
+        print(f"\n{result['metric']}:", file=buf)
+        print(f"  Files: {len(result['files'])}", file=buf)
+        print(f"  Values: {result['values']}", file=buf)
+        print(f"  Mean: {result['mean']:.2f}", file=buf)
+        print(f"  Std Dev: {result['std']:.2f}", file=buf)
+        print(f"  LaTeX: {result['latex']}", file=buf)
         if result.get("ci_95"):
             lo, hi = result["ci_95"]
-            print(f"  95% CI (t): [{lo:.2f}, {hi:.2f}]")
+            print(f"  95% CI (t): [{lo:.2f}, {hi:.2f}]", file=buf)
         
         if result['outliers']:
-            print(f"  ⚠️  WARNING: Outliers detected at indices {result['outliers']}")
+            print(f"  ⚠️  WARNING: Outliers detected at indices {result['outliers']}", file=buf)
             for idx in result['outliers']:
-                print(f"     - {result['files'][idx][0]}: {result['files'][idx][1]}")
+                print(f"     - {result['files'][idx][0]}: {result['files'][idx][1]}", file=buf)
         else:
-            print(f"  ✅ No outliers detected")
+            print(f"  ✅ No outliers detected", file=buf)
         
         # Check coefficient of variation (CV)
         if result['mean'] > 0:
             cv = (result['std'] / result['mean']) * 100
-            print(f"  Coefficient of Variation: {cv:.2f}%")
+            print(f"  Coefficient of Variation: {cv:.2f}%", file=buf)
             if cv > 20:
-                print(f"  ⚠️  WARNING: High variance (CV > 20%)")
+                print(f"  ⚠️  WARNING: High variance (CV > 20%)", file=buf)
             elif cv < 5:
-                print(f"  ✅ Low variance (CV < 5%)")
+                print(f"  ✅ Low variance (CV < 5%)", file=buf)
+    
+    sys.stdout.write(buf.getvalue())
     
     return results
 
@@ -525,19 +578,10 @@ def generate_latex_table(all_results):
     print("LaTeX TABLE FORMAT")
     print(f"{'='*80}\n")
     
-    # Group by load level
-    by_load = defaultdict(dict)
-    
-    for config_name, results in all_results.items():
-        # Parse config name (e.g., "Baseline 50" -> load=50, system="Baseline")
-        parts = config_name.split()
-        if len(parts) >= 2:
-            system = parts[0]
-            load = int(parts[1])
-            
-            if load not in by_load:
-                by_load[load] = {}
-            by_load[load][system] = results
+    # Group by load level (all_results is keyed by (system, load))
+    by_load = {}
+    for (system, load), results in all_results.items():
+        by_load.setdefault(load, {})[system] = results
     
     # Generate table
     print("\\begin{table}[h]")
@@ -610,13 +654,9 @@ def compare_baseline_gemini(all_results):
     print(f"{'='*80}\n")
 
     # Group by load similarly to generate_latex_table
-    by_load = defaultdict(dict)
-    for config_name, results in all_results.items():
-        parts = config_name.split()
-        if len(parts) >= 2:
-            system = parts[0]
-            load = int(parts[1])
-            by_load[load][system] = results
+    by_load = {}
+    for (system, load), results in all_results.items():
+        by_load.setdefault(load, {})[system] = results
 
     metrics_keys = [
         ('avg_latency', 'Avg Latency (ms)'),
@@ -682,36 +722,40 @@ def main():
     GRID_LOADS = ["50", "100", "150", "200", "250", "300"]
     
     if config_arg == 'all':
-        # Process all configurations
+        # Process all configurations; results are keyed by (system, load)
         all_results = {}
         
         configs = []
         for load in GRID_LOADS:
-            configs.append((f"Baseline {load}", "baseline", load))
-            configs.append((f"Gemini {load}", "gemini", load))
+            configs.append(("Baseline", "baseline", load))
+            configs.append(("Gemini", "gemini", load))
         
-        for config_name, folder, load in configs:
-            # Look for JSON files (with or without _run suffix)
-            json_pattern1 = f"results/{folder}/{load}.json"  # Exact match first
-            json_pattern2 = f"results/{folder}/{load}_run*.json"  # Then run-numbered files
-            
-            # Look for Locust CSV files (multiple patterns)
-            csv_pattern1 = f"results/{folder}/locust_{load}.csv"  # Exact match
-            csv_pattern2 = f"results/{folder}/locust_{load}_run*.csv"  # Run-numbered
-            csv_pattern3 = f"results/{folder}/{load}_run*_stats.csv"  # Stats files from runs
-            
-            # Do not bucket timestamped metrics-*.csv by latency — filenames lack load;
-            # mis-assigns 100/200/300. Use JSON + Locust only for grid statistics.
-            metrics_files = []
-            
-            json_files = list(project_root.glob(json_pattern1)) + list(project_root.glob(json_pattern2))
-            csv_files = (list(project_root.glob(csv_pattern1)) + 
-                        list(project_root.glob(csv_pattern2)) + 
-                        list(project_root.glob(csv_pattern3)))
+        # Discover files for every configuration first (one directory pass per
+        # folder), then load each file once
+        files_by_folder = {
+            folder: group_run_files(project_root / "results" / folder)
+            for folder in sorted({folder for _, folder, _ in configs})
+        }
+        
+        config_files = []
+        for system, folder, load in configs:
+            # Only load-tagged metrics-*-load{N}.csv exports are used (see METRICS_RUN_PATTERNS)
+            json_files, csv_files, metrics_files = files_by_folder[folder].get(load, ([], [], []))
             
             if json_files or csv_files or metrics_files:
-                results = process_test_configuration(config_name, json_files, csv_files, metrics_files)
-                all_results[config_name] = results
+                config_files.append(((system, int(load)), json_files, csv_files, metrics_files))
+        
+        file_data_map = preload_run_files(
+            f
+            for _, json_files, csv_files, metrics_files in config_files
+            for f in json_files + csv_files + metrics_files
+        )
+        
+        for (system, load), json_files, csv_files, metrics_files in config_files:
+            results = process_test_configuration(
+                f"{system} {load}", json_files, csv_files, metrics_files, file_data_map
+            )
+            all_results[(system, load)] = results
         
         # Generate LaTeX table
         generate_latex_table(all_results)
@@ -728,17 +772,11 @@ def main():
             ("Ablation QueryOpt", f"ablation/query_opt_only", load),
         ]
         for config_name, rel_folder, ld in ablation_configs:
-            base = project_root / "results" / rel_folder
-            json_files = sorted(
-                set(list(base.glob(f"{ld}.json")) + list(base.glob(f"{ld}_run*.json")))
-            )
-            csv_files = sorted(
-                set(
-                    list(base.glob(f"locust_{ld}.csv"))
-                    + list(base.glob(f"locust_{ld}_run*.csv"))
-                    + list(base.glob(f"{ld}_run*_stats.csv"))
-                )
-            )
+            json_files, csv_files, _ = group_run_files(
+                project_root / "results" / rel_folder
+            ).get(ld, ([], [], []))
+            json_files = sorted(json_files)
+            csv_files = sorted(csv_files)
             metrics_files = []
             if json_files or csv_files:
                 results = process_test_configuration(
@@ -760,25 +798,16 @@ def main():
         folder = parts[0]
         load = parts[1]
         
-        json_pattern1 = f"results/{folder}/{load}.json"
-        json_pattern2 = f"results/{folder}/{load}_run*.json"
-        csv_pattern1 = f"results/{folder}/locust_{load}.csv"
-        csv_pattern2 = f"results/{folder}/locust_{load}_run*.csv"
-        csv_pattern3 = f"results/{folder}/{load}_run*_stats.csv"
-        
-        # Avoid ambiguous metrics-*.csv bucketing for arbitrary loads
-        metrics_files = []
-        
-        json_files = list(project_root.glob(json_pattern1)) + list(project_root.glob(json_pattern2))
-        csv_files = (list(project_root.glob(csv_pattern1)) + 
-                    list(project_root.glob(csv_pattern2)) + 
-                    list(project_root.glob(csv_pattern3)))
+        json_files, csv_files, metrics_files = group_run_files(
+            project_root / "results" / folder
+        ).get(load, ([], [], []))
         
         if not json_files and not csv_files and not metrics_files:
             print(f"Error: No files found for {config_arg}")
             print(
-                f"  Looked for: {json_pattern1}, {json_pattern2}, "
-                f"{csv_pattern1}, {csv_pattern2}, {csv_pattern3}"
+                f"  Looked for: results/{folder}/{load}.json, results/{folder}/{load}_run*.json, "
+                f"results/{folder}/locust_{load}.csv, results/{folder}/locust_{load}_run*.csv, "
+                f"results/{folder}/{load}_run*_stats.csv, results/{folder}/metrics-*-load{load}.csv"
             )
             sys.exit(1)
         
@@ -2,51 +2,56 @@
 """
 Example: Compute statistics from manually provided data
 Use this if you have results from 3 runs in CSV/JSON format
+
+The helpers are fully annotated so the file also runs unchanged under PyPy,
+or can be compiled with mypyc (copy it to an importable name first, e.g.
+manual_stats.py, then `mypyc manual_stats.py`).
 """
 
+from __future__ import annotations
+
 import json
 import sys
-import numpy as np
 
-def compute_stats(values):
-    """Compute mean and sample standard deviation"""
-    if not values or len(values) == 0:
-        return (0, 0, 0)
+# Below this many values, plain Python (especially under PyPy/mypyc) beats
+# numpy's import and array overhead
+NUMPY_MIN_VALUES = 1024
+
+def summarize(values: list[float | None], threshold: float = 2.0) -> tuple[float, float, int, list[int]]:
+    """
+    Compute mean, sample standard deviation, count and z-score outliers
+    Outlier indices (|z| > threshold, needs 3+ values) refer to the non-None values
+    """
+    floats = [float(v) for v in values if v is not None]
+    n = len(floats)
+    if n == 0:
+        return (0, 0, 0, [])
     
-    values = [float(v) for v in values if v is not None]
-    if len(values) == 0:
-        return (0, 0, 0)
+    if n > NUMPY_MIN_VALUES:
+        import numpy as np
+        arr = np.asarray(floats)
+        mean = float(arr.mean())
+        std = float(arr.std(ddof=1))
+        outliers = np.nonzero(np.abs(arr - mean) / std > threshold)[0].tolist() if std > 0 else []
+        return (mean, std, n, outliers)
     
-    n = len(values)
-    mean = np.mean(values)
+    mean = sum(floats) / n
     
     if n == 1:
         std = 0.0
     else:
-        std = np.std(values, ddof=1)  # Sample standard deviation (n-1)
+        # Sample standard deviation (n-1)
+        std = (sum((x - mean) ** 2 for x in floats) / (n - 1)) ** 0.5
+    
+    if n < 3 or std == 0:
+        return (mean, std, n, [])
     
-    return (mean, std, n)
+    return (mean, std, n, [i for i, x in enumerate(floats) if abs(x - mean) / std > threshold])
 
-def format_latex(mean, std, decimals=2):
+def format_latex(mean: float, std: float, decimals: int = 2) -> str:
     """Format as LaTeX: mean \\pm SD"""
     return f"{mean:.{decimals}f} \\pm {std:.{decimals}f}"
 
-def check_outliers(values, threshold=2.0):
-    """Check for outliers using z-score"""
-    if len(values) < 3:
-        return []
-    
-    values_arr = np.array([float(v) for v in values])
-    mean = np.mean(values_arr)
-    std = np.std(values_arr, ddof=1)
-    
-    if std == 0:
-        return []
-    
-    z_scores = np.abs((values_arr - mean) / std)
-    outliers = np.where(z_scores > threshold)[0].tolist()
-    return outliers
-
 # Example usage
 if __name__ == "__main__":
     print("="*80)
@@ -70,8 +75,7 @@ if __name__ == "__main__":
     print("-"*80)
     
     for metric_name, values in example_data.items():
-        mean, std, n = compute_stats(values)
-        outliers = check_outliers(values)
+        mean, std, n, outliers = summarize(values)
         cv = (std / mean * 100) if mean > 0 else 0
         
         print(f"\n{metric_name}:")
@@ -121,7 +121,7 @@ run_condition() {
 
   # Also trigger CSV export via metrics export endpoint (server-side summary)
   echo "[METRICS] Triggering server-side CSV export via /metrics/export..."
-  curl -s -X POST http://localhost:3000/metrics/export > /dev/null 2>&1 || {
+  curl -s -X POST "http://localhost:3000/metrics/export?load=$users" > /dev/null 2>&1 || {
     echo "WARNING: /metrics/export failed (exportToCSV)"
   }
 
@@ -57,9 +57,9 @@ app.get('/metrics', (req, res) => {
   });
 });
 
-// Export metrics endpoint
+// Export metrics endpoint (optional ?load=<users> tags the exported file names)
 app.post('/metrics/export', (req, res) => {
-  const filename = exportToCSV();
+  const filename = exportToCSV(req.query.load);
   res.json({ message: 'Metrics exported', filename });
 });
 
@@ -127,7 +127,7 @@ function calculateStats() {
   };
 }
 
-function exportToCSV() {
+function exportToCSV(load) {
   const stats = calculateStats();
   if (!stats) {
     console.log('No metrics to export');
@@ -137,7 +137,9 @@ function exportToCSV() {
   const version = process.env.APP_VERSION || 'baseline';
   const timestamp = new Date().toISOString().replace(/[:.]/g, '-');
   const resultsSubdir = version === 'optimized' ? 'gemini' : 'baseline';
-  const filename = `results/${resultsSubdir}/metrics-${version}-${timestamp}.csv`;
+  // Tag the file with the load level when known, so stats scripts can group runs by name
+  const loadTag = /^\d+$/.test(String(load || '')) ? `-load${load}` : '';
+  const filename = `results/${resultsSubdir}/metrics-${version}-${timestamp}${loadTag}.csv`;
 
   // Ensure subdirectory exists
   const subdir = path.join(resultsDir, resultsSubdir);
@@ -158,7 +160,7 @@ Cache Hit Ratio (%),${stats.cacheHitRatio}
   console.log(`Metrics exported to ${filename}`);
 
   // Also write detailed request log
-  const requestsFile = `results/${resultsSubdir}/requests-${version}-${timestamp}.csv`;
+  const requestsFile = `results/${resultsSubdir}/requests-${version}-${timestamp}${loadTag}.csv`;
   const requestsCSV = 'timestamp,method,path,duration\n' +
     metrics.requests.map(r => `${r.timestamp},${r.method},${r.path},${r.duration}`).join('\n');
   fs.writeFileSync(requestsFile, requestsCSV);